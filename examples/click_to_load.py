@@ -1,4 +1,5 @@
-from typing import Self, override
+import functools
+from typing import Final, Self, override
 
 from examples import Page
 
@@ -7,7 +8,7 @@ from ludic.catalog.headers import H1, H2
 from ludic.catalog.quotes import Quote
 from ludic.catalog.tables import Table, TableHead, TableRow
 from ludic.html import td
-from ludic.types import Attrs, Blank, Component, ComponentStrict
+from ludic.types import Attrs, Blank, Component, ComponentStrict, Safe
 from ludic.web import Endpoint, LudicApp
 from ludic.web.datastructures import QueryParams
 
@@ -22,22 +23,26 @@ class ContactAttrs(Attrs):
 
 class ContactsSliceAttrs(Attrs):
     page: int
-    contacts: list[ContactAttrs]
+    contacts: tuple[ContactAttrs, ...]
 
 
 class LoadMoreAttrs(Attrs):
     url: str
 
 
-def load_contacts(page: int) -> list[ContactAttrs]:
-    return [
+@functools.lru_cache(maxsize=256)
+def load_contacts(page: int) -> tuple[ContactAttrs, ...]:
+    return tuple(
         ContactAttrs(
             id=str(page * 10 + idx),
             email=f"void{page * 10 + idx}@null.org",
             name="Agent Smith",
         )
         for idx in range(10)
-    ]
+    )
+
+
+CONTACTS_TABLE_HEAD: Final[Safe] = Safe(TableHead("ID", "Name", "Email").to_html())
 
 
 class LoadMoreButton(ComponentStrict[LoadMoreAttrs]):
@@ -85,8 +90,10 @@ class ContactsSlice(Endpoint[ContactsSliceAttrs]):
             TableRow(
                 td(
                     LoadMoreButton(
-                        url=self.url_for(ContactsSlice).include_query_params(
-                            page=next_page
+                        url=str(
+                            self.url_for(ContactsSlice).include_query_params(
+                                page=next_page
+                            )
                         ),
                     ),
                     colspan=3,
@@ -98,9 +105,9 @@ class ContactsSlice(Endpoint[ContactsSliceAttrs]):
 
 class ContactsTable(Component[ContactsSlice, Attrs]):
     @override
-    def render(self) -> Table[TableHead, ContactsSlice]:
+    def render(self) -> Table[Blank[Safe], ContactsSlice]:
         return Table(
-            TableHead("ID", "Name", "Email"),
+            Blank(CONTACTS_TABLE_HEAD),
             *self.children,
             classes=["text-align-center"],
         )
@@ -1,8 +1,12 @@
+import inspect
+import threading
 from abc import ABCMeta
-from collections.abc import Callable, Iterator, Mapping, MutableMapping, Sequence
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, Mapping, MutableMapping, Sequence
 from typing import (
     Any,
     ClassVar,
+    Final,
     Generic,
     Never,
     TypeAlias,
@@ -15,10 +19,42 @@ from typing_extensions import TypeVar, TypeVarTuple
 
 from .format import FormatContext, format_attrs, format_element
 from .styles import GlobalStyles, Theme, get_default_theme
-from .utils import get_element_attrs_annotations
+from .utils import get_element_attrs_keys
 
 ELEMENT_REGISTRY: MutableMapping[str, list[type["BaseElement"]]] = {}
 
+RENDER_CACHE_MAXSIZE: Final[int] = 1024
+RENDER_CACHE: OrderedDict[Hashable, str] = OrderedDict()
+RENDER_CACHE_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+class _IdentityKey:
+    """Cache key part comparing the wrapped object by identity.
+
+    The object is referenced by the key, so its identity cannot be reused by
+    another object while the key is cached.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: object) -> None:
+        self.obj = obj
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+
+def clear_render_cache() -> None:
+    """Clear the cache of rendered HTML fragments of cacheable elements.
+
+    Call this when data the cacheable elements are rendered from changes.
+    """
+    with RENDER_CACHE_LOCK:
+        RENDER_CACHE.clear()
+
 
 class Safe(str):
     """Marker for a string that is safe to use as is without HTML escaping.
@@ -75,6 +111,8 @@ class BaseElement(metaclass=ABCMeta):
     html_name: ClassVar[str | None] = None
 
     always_pair: ClassVar[bool] = False
+    cacheable: ClassVar[bool] = False
+    render_in_threadpool: ClassVar[bool] = False
     formatter: ClassVar[FormatContext] = FormatContext("element_formatter")
 
     classes: ClassVar[Sequence[str]] = []
@@ -86,6 +124,12 @@ class BaseElement(metaclass=ABCMeta):
     context: dict[str, Any]
 
     def __init_subclass__(cls) -> None:
+        # to_html calls render synchronously, a coroutine would never be awaited
+        if inspect.iscoroutinefunction(cls.render):
+            raise TypeError(
+                f"The {cls.__name__}.render method must not be a coroutine function."
+            )
+
         ELEMENT_REGISTRY.setdefault(cls.__name__, [])
         ELEMENT_REGISTRY[cls.__name__].append(cls)
 
@@ -136,16 +180,112 @@ class BaseElement(metaclass=ABCMeta):
             for key, value in attrs.items()
         )
 
-    def _format_children(
-        self,
-        format_fun: Callable[[Any], str] = format_element,
-    ) -> str:
-        formatted = []
+    def _write_children(
+        self, buffer: list[str], cache_keys: dict[int, Hashable | None] | None = None
+    ) -> None:
+        for child in self.children:
+            if isinstance(child, BaseElement):
+                child.context.update(self.context)
+                if type(child).to_html is not BaseElement.to_html:
+                    buffer.append(child.to_html())
+                else:
+                    child._write_html(buffer, cache_keys)
+            else:
+                buffer.append(format_element(child))
+
+    def _cache_key(self, cache_keys: dict[int, Hashable | None]) -> Hashable | None:
+        key: Hashable | None = None
+        children_keys: list[Hashable] = []
         for child in self.children:
             if isinstance(child, BaseElement):
+                if not child.cacheable and type(child).render is not BaseElement.render:
+                    break
+                # the context is propagated as rendering would, so that the key
+                # reflects the theme the child is eventually rendered with
                 child.context.update(self.context)
-            formatted.append(format_fun(child))
-        return "".join(formatted)
+                if (child_key := child._cache_key(cache_keys)) is None:
+                    break
+                children_keys.append(child_key)
+            elif isinstance(child, str | int | float | bool):
+                children_keys.append((type(child), child))
+            else:
+                break
+        else:
+            attrs_key = tuple(
+                (name, type(value), value) for name, value in self.attrs.items()
+            )
+            try:
+                hash(attrs_key)
+            except TypeError:
+                pass
+            else:
+                # themes compare equal by name, customised instances of a theme
+                # must not share fragments, so the instance itself is the key
+                theme_key = _IdentityKey(self.theme)
+                key = (type(self), theme_key, attrs_key, tuple(children_keys))
+
+        cache_keys[id(self)] = key
+        return key
+
+    def _write_html(
+        self, buffer: list[str], cache_keys: dict[int, Hashable | None] | None = None
+    ) -> None:
+        if not self.cacheable:
+            self._write_dom(buffer, cache_keys)
+            return
+
+        # keys of the whole subtree are computed once by the outermost
+        # cacheable element and passed down to the nested ones
+        if cache_keys is None or id(self) not in cache_keys:
+            cache_keys = {}
+            self._cache_key(cache_keys)
+        if (key := cache_keys[id(self)]) is None:
+            self._write_dom(buffer, cache_keys)
+            return
+
+        # elements can be rendered in several threads, e.g. in a thread pool
+        with RENDER_CACHE_LOCK:
+            if (fragment := RENDER_CACHE.get(key)) is not None:
+                RENDER_CACHE.move_to_end(key)
+
+        if fragment is None:
+            fragment_buffer: list[str] = []
+            self._write_dom(fragment_buffer, cache_keys)
+            fragment = "".join(fragment_buffer)
+            with RENDER_CACHE_LOCK:
+                RENDER_CACHE[key] = fragment
+                if len(RENDER_CACHE) > RENDER_CACHE_MAXSIZE:
+                    RENDER_CACHE.popitem(last=False)
+        buffer.append(fragment)
+
+    def _write_dom(
+        self, buffer: list[str], cache_keys: dict[int, Hashable | None] | None = None
+    ) -> None:
+        dom = self
+        classes = list(dom.classes)
+
+        while dom != (rendered_dom := dom.render()):
+            rendered_dom.context.update(dom.context)
+            dom = rendered_dom
+            classes += dom.classes
+
+        if dom.html_header:
+            buffer.append(f"{dom.html_header}\n")
+
+        hidden = dom.html_name == "__hidden__"
+        if not hidden:
+            buffer.append(f"<{dom.html_name}")
+            if dom.has_attributes() or classes:
+                buffer.append(f" {dom._format_attributes(classes, is_html=True)}")
+
+        if dom.children or dom.always_pair:
+            if not hidden:
+                buffer.append(">")
+            dom._write_children(buffer, cache_keys)
+            if not hidden:
+                buffer.append(f"</{dom.html_name}>")
+        elif not hidden:
+            buffer.append(" />")
 
     @property
     def aliased_attrs(self) -> dict[str, Any]:
@@ -211,33 +351,14 @@ class BaseElement(metaclass=ABCMeta):
         return element
 
     def to_html(self) -> str:
-        """Convert an element tree to an HTML string."""
-        dom = self
-        classes = list(dom.classes)
-
-        while dom != (rendered_dom := dom.render()):
-            rendered_dom.context.update(dom.context)
-            dom = rendered_dom
-            classes += dom.classes
+        """Convert an element tree to an HTML string.
 
-        element_tag = f"{dom.html_header}\n" if dom.html_header else ""
-
-        hidden = dom.html_name == "__hidden__"
-        element_tag += "" if hidden else f"<{dom.html_name}"
-
-        if not hidden and (dom.has_attributes() or classes):
-            attributes_str = dom._format_attributes(classes, is_html=True)
-            element_tag += f" {attributes_str}"
-
-        if dom.children or dom.always_pair:
-            children_str = dom._format_children()
-            element_tag += (
-                children_str if hidden else f">{children_str}</{dom.html_name}>"
-            )
-        elif not hidden:
-            element_tag += " />"
-
-        return element_tag
+        The whole tree is written into a single buffer which is joined once
+        at the end, no intermediate strings are created for nested elements.
+        """
+        buffer: list[str] = []
+        self._write_html(buffer)
+        return "".join(buffer)
 
     def attrs_for(self, cls: type["BaseElement"]) -> dict[str, Any]:
         """Get the attributes of this component that are defined in the given element.
@@ -249,11 +370,8 @@ class BaseElement(metaclass=ABCMeta):
             cls (type[BaseElement]): The element to get the attributes of.
 
         """
-        return {
-            key: value
-            for key, value in self.attrs.items()
-            if key in get_element_attrs_annotations(cls)
-        }
+        keys = get_element_attrs_keys(cls)
+        return {key: value for key, value in self.attrs.items() if key in keys}
 
     def render(self) -> "BaseElement":
         return self
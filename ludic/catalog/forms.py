@@ -1,8 +1,9 @@
 """An experimental module for creating HTML forms."""
 
+import functools
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
-from typing import Any, Literal, get_type_hints, override
+from dataclasses import dataclass, field
+from typing import Any, Literal, override
 
 from ludic.attrs import Attrs, FormAttrs, InputAttrs, TextAreaAttrs
 from ludic.html import div, form, input, label, style, textarea
@@ -15,16 +16,16 @@ from ludic.types import (
     TAttrs,
     TChildren,
 )
-from ludic.utils import get_annotations_metadata_of_type
+from ludic.utils import get_annotations_metadata_of_type, get_cached_type_hints
 
 from .utils import attr_to_camel
 
 DEFAULT_FIELD_PARSERS: Mapping[str, Callable[[Any], PrimitiveChildren]] = {
-    "checkbox": lambda value: True if value == "on" else False,
+    "checkbox": lambda value: value == "on",
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FieldMeta:
     """Class to be used in attributes annotations to create form fields.
 
@@ -49,31 +50,65 @@ class FieldMeta:
     attrs: InputAttrs | TextAreaAttrs | None = None
     parser: Callable[[Any], PrimitiveChildren] | None = None
 
-    def format(self, key: str, value: Any) -> BaseElement:
-        attrs = {} if self.attrs is None else dict(self.attrs)
-        attrs["name"] = key
+    _base_attrs: dict[str, Any] = field(init=False, repr=False, compare=False)
+    _auto_label: bool = field(init=False, repr=False, compare=False)
+    _build: Callable[[str, Any], BaseElement] = field(
+        init=False, repr=False, compare=False
+    )
+    _parse: Callable[[Any], PrimitiveChildren] = field(
+        init=False, repr=False, compare=False
+    )
 
-        if self.label:
-            attrs["label"] = self.label
-        elif self.label == "auto":
-            attrs["label"] = attr_to_camel(key)
+    def __post_init__(self) -> None:
+        base_attrs: dict[str, Any] = {} if self.attrs is None else dict(self.attrs)
+        base_attrs.pop("name", None)
+        if self.label == "auto":
+            base_attrs.pop("label", None)
+        elif self.label:
+            base_attrs["label"] = self.label
 
+        build: Callable[[str, Any], BaseElement]
         match self.kind:
             case "input":
-                return InputField(value=value, type=self.type, **attrs)
+                build = self._build_input
             case "checkbox":
-                return InputField(checked=value, type="checkbox", **attrs)
+                build = self._build_checkbox
             case "textarea":
-                return TextAreaField(value=value, **attrs)
+                build = self._build_textarea
+
+        object.__setattr__(self, "_base_attrs", base_attrs)
+        object.__setattr__(self, "_auto_label", self.label == "auto")
+        object.__setattr__(self, "_build", build)
+        object.__setattr__(
+            self,
+            "_parse",
+            self.parser
+            if self.parser is not None
+            else DEFAULT_FIELD_PARSERS.get(self.kind, str),
+        )
+
+    def _field_attrs(self, key: str) -> dict[str, Any]:
+        if self._auto_label:
+            return {**self._base_attrs, "name": key, "label": attr_to_camel(key)}
+        return {**self._base_attrs, "name": key}
+
+    def _build_input(self, key: str, value: Any) -> BaseElement:
+        return InputField(value=value, type=self.type, **self._field_attrs(key))
+
+    def _build_checkbox(self, key: str, value: Any) -> BaseElement:
+        return InputField(checked=value, type="checkbox", **self._field_attrs(key))
+
+    def _build_textarea(self, key: str, value: Any) -> BaseElement:
+        return TextAreaField(value, **self._field_attrs(key))
+
+    def format(self, key: str, value: Any) -> BaseElement:
+        return self._build(key, value)
 
     def parse(self, value: Any) -> PrimitiveChildren:
-        if self.parser:
-            return self.parser(value)
-        else:
-            return DEFAULT_FIELD_PARSERS.get(self.kind, str)(value)
+        return self._parse(value)
 
     def __call__(self, value: Any) -> PrimitiveChildren:
-        return self.parse(value)
+        return self._parse(value)
 
 
 class FieldAttrs(Attrs, total=False):
@@ -120,12 +155,6 @@ class FormField(Component[TChildren, TAttrs]):
         }
     )
 
-    def create_label(self, text: PrimitiveChildren, for_: str = "") -> label:
-        if for_:
-            return label(text, for_=for_)
-        else:
-            return label(text)
-
 
 class InputField(FormField[NoChildren, InputFieldAttrs]):
     """Represents the HTML ``input`` element with an optional ``label`` element."""
@@ -136,12 +165,14 @@ class InputField(FormField[NoChildren, InputFieldAttrs]):
         if "name" in self.attrs:
             attrs["id"] = self.attrs["name"]
 
-        elements: list[ComplexChildren] = []
         if text := self.attrs.get("label"):
-            elements.append(self.create_label(text=text, for_=attrs.get("id", "")))
-        elements.append(input(**attrs))
-
-        return div(*elements)
+            return div(
+                label(text, for_=field_id)
+                if (field_id := attrs.get("id"))
+                else label(text),
+                input(**attrs),
+            )
+        return div(input(**attrs))
 
 
 class TextAreaField(FormField[PrimitiveChildren, TextAreaFieldAttrs]):
@@ -153,12 +184,14 @@ class TextAreaField(FormField[PrimitiveChildren, TextAreaFieldAttrs]):
         if "name" in self.attrs:
             attrs["id"] = self.attrs["name"]
 
-        elements: list[ComplexChildren] = []
         if text := self.attrs.get("label"):
-            elements.append(self.create_label(text=text, for_=attrs.get("id", "")))
-        elements.append(textarea(self.children[0], **attrs))
-
-        return div(*elements)
+            return div(
+                label(text, for_=field_id)
+                if (field_id := attrs.get("id"))
+                else label(text),
+                textarea(self.children[0], **attrs),
+            )
+        return div(textarea(self.children[0], **attrs))
 
 
 class Form(Component[ComplexChildren, FormAttrs]):
@@ -171,6 +204,38 @@ class Form(Component[ComplexChildren, FormAttrs]):
         return form(*self.children, **self.attrs)
 
 
+FieldsPlan = tuple[tuple[str, FieldMeta], ...]
+
+
+def get_fields_plan(spec: Any) -> FieldsPlan:
+    """Get the form fields plan of the given specification.
+
+    The plan is a tuple of attribute names paired with their :class:`FieldMeta`.
+    It is memoized per specification. Attributes' specifications are
+    :class:`TypedDict` classes which cannot run any hook at class definition
+    time, so the plan is built on first use.
+
+    Args:
+        spec (Any): The specification of the attributes.
+
+    Returns:
+        FieldsPlan: The attribute names paired with their metadata.
+    """
+    return _get_fields_plan(spec)
+
+
+@functools.cache
+def _get_fields_plan(spec: Any) -> FieldsPlan:
+    annotations = get_cached_type_hints(spec, include_extras=True)
+    return tuple(get_annotations_metadata_of_type(annotations, FieldMeta).items())
+
+
+def _get_attr_value(attrs: Any, name: str) -> Any:
+    if (value := attrs.get(name)) is None:
+        value = getattr(attrs, name, None)
+    return value
+
+
 def create_fields(attrs: Any, spec: type[TAttrs]) -> tuple[ComplexChildren, ...]:
     """Create form fields from the given attributes.
 
@@ -195,13 +260,8 @@ def create_fields(attrs: Any, spec: type[TAttrs]) -> tuple[ComplexChildren, ...]
     Returns:
         ComplexChild: list of form fields.
     """
-    annotations = get_type_hints(spec, include_extras=True)
-    metadata_list = get_annotations_metadata_of_type(annotations, FieldMeta)
-    fields: list[ComplexChildren] = []
-
-    for name, metadata in metadata_list.items():
-        if value := (attrs.get(name) or getattr(attrs, name, None)):
-            field = metadata.format(name, value)
-            fields.append(field)
-
-    return tuple(fields)
+    return tuple(
+        metadata.format(name, value)
+        for name, metadata in get_fields_plan(spec)
+        if (value := _get_attr_value(attrs, name)) is not None
+    )
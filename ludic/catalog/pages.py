@@ -37,13 +37,15 @@ class Head(Component[AnyChildren, HtmlHeadAttrs]):
 class Body(Component[AnyChildren, HtmlBodyAttrs]):
     @override
     def render(self) -> body:
-        scripts = []
         if htmx_path := self.attrs.get("htmx_path"):
-            scripts.append(script(src=htmx_path))
+            return body(*self.children, script(src=htmx_path))
         elif self.attrs.get("htmx_enabled", "htmx_version" in self.attrs):
             htmx_version = self.attrs.get("htmx_version", "latest")
-            scripts.append(script(src=f"https://unpkg.com/htmx.org@{htmx_version}"))
-        return body(*self.children, *scripts)
+            return body(
+                *self.children,
+                script(src=f"https://unpkg.com/htmx.org@{htmx_version}"),
+            )
+        return body(*self.children)
 
 
 class HtmlPage(ComponentStrict[Head, Body, NoAttrs]):
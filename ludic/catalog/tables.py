@@ -22,7 +22,7 @@ from .forms import FieldMeta
 from .utils import attr_to_camel
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnMeta:
     """Class to be used as an annotation for attributes.
 
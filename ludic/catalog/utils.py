@@ -1,3 +1,7 @@
+import functools
+
+
+@functools.lru_cache(maxsize=512)
 def attr_to_camel(name: str) -> str:
     """Convert an attribute name to camel case.
 
@@ -7,7 +11,8 @@ def attr_to_camel(name: str) -> str:
     Returns:
         str: The attribute name in camel case.
     """
-    return " ".join(value.title() for value in name.split("_"))
+    # str methods run in C, which beats both a Python loop and a JIT here
+    return name.replace("_", " ").title()
 
 
 def text_to_kebab(name: str) -> str:
@@ -1,3 +1,4 @@
+import functools
 import html
 import random
 import re
@@ -37,6 +38,30 @@ def format_attr_value(key: str, value: Any, is_html: bool = False) -> str:
     return str(value)
 
 
+@functools.cache
+def get_attrs_aliases(attrs_type: Any) -> dict[str, str]:
+    """Get the HTML aliases of the element's attributes.
+
+    Attributes annotated with an alias, e.g. ``Annotated[str, "class"]``, map
+    to the alias, other declared attributes map to themselves.
+
+    Args:
+        attrs_type (Any): The element.
+
+    Returns:
+        dict[str, str]: Mapping of attribute names to their aliases.
+    """
+    aliases: dict[str, str] = {}
+    hints = get_element_attrs_annotations(attrs_type, include_extras=True)
+    for key, hint in hints.items():
+        aliases[key] = key
+        if get_origin(hint) is Annotated:
+            args = get_args(hint)
+            if len(args) > 1 and isinstance(args[1], str):
+                aliases[key] = args[1]
+    return aliases
+
+
 def format_attrs(
     attrs_type: Any, attrs: dict[str, Any], is_html: bool = False
 ) -> dict[str, Any]:
@@ -65,19 +90,12 @@ def format_attrs(
     Returns:
         dict[str, Any]: The formatted attributes.
     """
-    hints = get_element_attrs_annotations(attrs_type, include_extras=True)
-
-    def _get_key(key: str) -> str:
-        if get_origin(hints[key]) is Annotated:
-            args = get_args(hints[key])
-            if len(args) > 1 and isinstance(args[1], str):
-                return args[1]
-        return key
+    aliases = get_attrs_aliases(attrs_type)
 
     result: dict[str, str] = {}
     for key, value in attrs.items():
         if formatted_value := format_attr_value(key, value, is_html=is_html):
-            alias = _get_key(key)
+            alias = aliases[key]
             if alias in result:
                 result[alias] += " " + formatted_value
             else:
@@ -1,4 +1,4 @@
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Hashable, Iterator
 from typing import Self, Unpack, override
 
 from .attrs import (
@@ -355,7 +355,9 @@ class style(BaseElement, GlobalStyles):
     def styles(self, value: GlobalStyles) -> None:
         self.children = (value,)
 
-    def to_html(self) -> str:
+    def _write_html(
+        self, buffer: list[str], cache_keys: dict[int, Hashable | None] | None = None
+    ) -> None:
         dom: BaseElement = self
         while dom != (rendered_dom := dom.render()):
             dom = rendered_dom
@@ -369,7 +371,7 @@ class style(BaseElement, GlobalStyles):
         else:
             css_styles = format_styles(self.styles)
 
-        return (
+        buffer.append(
             f"<{dom.html_name}{attributes}>\n"
             f"{css_styles}\n"
             f"</{dom.html_name}>"
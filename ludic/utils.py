@@ -1,5 +1,7 @@
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import (
-    Annotated,
     Any,
     TypeVar,
     get_args,
@@ -33,9 +35,25 @@ def get_element_generic_args(cls_or_obj: Any) -> tuple[type, ...] | None:
     return None
 
 
+@functools.cache
+def get_cached_type_hints(obj: Any, include_extras: bool = False) -> Mapping[str, Any]:
+    """Get type hints of the given object, memoized per object.
+
+    The returned mapping is shared between calls, so it is read-only.
+
+    Args:
+        obj (Any): The object to get the type hints of.
+        include_extras (bool): Whether to include extra annotation info.
+
+    Returns:
+        Mapping[str, Any]: The type hints of the object.
+    """
+    return MappingProxyType(get_type_hints(obj, include_extras=include_extras))
+
+
 def get_element_attrs_annotations(
     cls_or_obj: Any, include_extras: bool = False
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """Get the annotations of the element.
 
     Args:
@@ -43,22 +61,35 @@ def get_element_attrs_annotations(
         include_extras (bool): Whether to include extra annotation info.
 
     Returns:
-        dict[str, Any]: The attributes' annotations of the element.
+        Mapping[str, Any]: The read-only attributes' annotations of the element.
     """
     if (args := get_element_generic_args(cls_or_obj)) is not None:
-        return get_type_hints(args[-1], include_extras=include_extras)
+        return get_cached_type_hints(args[-1], include_extras=include_extras)
     return {}
 
 
+@functools.cache
+def get_element_attrs_keys(cls: Any) -> frozenset[str]:
+    """Get the names of the attributes of the element class.
+
+    Args:
+        cls (Any): The element class to get the attribute names of.
+
+    Returns:
+        frozenset[str]: The attribute names of the element.
+    """
+    return frozenset(get_element_attrs_annotations(cls))
+
+
 def get_annotations_metadata_of_type(
-    annotations: dict[str, Any],
+    annotations: Mapping[str, Any],
     expected_type: type[_T],
     default: _T | None = None,
 ) -> dict[str, _T]:
     """Get the metadata of the annotations with the given type.
 
     Args:
-        annotations (dict[str, Any]): The annotations.
+        annotations (Mapping[str, Any]): The annotations.
         expected_type (Any): The expected type.
         default (Any, optional): The default type.
 
@@ -67,9 +98,10 @@ def get_annotations_metadata_of_type(
     """
     result: dict[str, _T] = {}
     for name, annotation in annotations.items():
-        if get_origin(annotation) is not Annotated:
+        # only Annotated[...] hints carry metadata
+        if (annotation_metadata := getattr(annotation, "__metadata__", None)) is None:
             continue
-        for metadata in annotation.__metadata__:
+        for metadata in annotation_metadata:
             if isinstance(metadata, expected_type):
                 result[name] = metadata
                 break
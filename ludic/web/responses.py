@@ -1,6 +1,6 @@
 import inspect
 from collections.abc import Callable
-from typing import Any, ParamSpec, TypeVar, get_origin
+from typing import Any, Final, ParamSpec, TypeVar, get_origin
 
 from starlette._utils import is_async_callable
 from starlette.concurrency import run_in_threadpool
@@ -35,6 +35,9 @@ __all__ = (
 T = TypeVar("T")
 P = ParamSpec("P")
 
+LARGE_RESPONSE_ELEMENTS: Final[int] = 1000
+"""Number of elements from which an opted-in response is rendered in a thread pool."""
+
 
 async def run_in_threadpool_safe(
     func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
@@ -47,6 +50,55 @@ async def run_in_threadpool_safe(
     return response
 
 
+def is_large_element(
+    element: BaseElement, limit: int = LARGE_RESPONSE_ELEMENTS
+) -> bool:
+    """Check whether the element tree contains at least the given number of elements.
+
+    Only elements already present in the tree are counted, components are not
+    rendered. A component generating a large tree from few children is
+    therefore not considered large. The counting stops as soon as the limit
+    is reached.
+
+    Args:
+        element: The root of the element tree.
+        limit: The number of elements from which the tree is considered large.
+
+    Returns:
+        Whether the element tree is large.
+    """
+    count = 0
+    stack = [element]
+    while stack:
+        count += 1
+        if count >= limit:
+            return True
+        stack.extend(
+            child for child in stack.pop().children if isinstance(child, BaseElement)
+        )
+    return False
+
+
+async def prerender_element(element: BaseElement) -> BaseElement | str:
+    """Render a large element tree in a thread pool if the element opts in.
+
+    Rendering is CPU-bound, so large trees would block the event loop. If the
+    root element sets the ``render_in_threadpool`` class attribute, the tree is
+    rendered in a thread pool if it is large. Nested elements are not checked.
+    Other trees are returned as they are, dispatching small trees to a thread
+    would cost more than rendering them.
+
+    Args:
+        element: The element tree to render.
+
+    Returns:
+        The rendered HTML of a large opted-in tree, otherwise the element itself.
+    """
+    if element.render_in_threadpool and is_large_element(element):
+        return await run_in_threadpool_safe(element.to_html)
+    return element
+
+
 async def prepare_response(
     handler: Callable[..., Any],
     request: Request,
@@ -93,7 +145,9 @@ async def prepare_response(
     if isinstance(raw_response, BaseElement):
         raw_response.context["request"] = request
         response = LudicResponse(
-            raw_response, status_code=status_code or 200, headers=headers
+            await prerender_element(raw_response),
+            status_code=status_code or 200,
+            headers=headers,
         )
     elif isinstance(raw_response, str | bool | int | float):
         response = PlainTextResponse(
@@ -148,5 +202,7 @@ async def extract_from_request(
 class LudicResponse(HTMLResponse):
     """Response class for Ludic components."""
 
-    def render(self, content: BaseElement) -> bytes:
+    def render(self, content: BaseElement | str) -> bytes:
+        if isinstance(content, str):
+            return content.encode("utf-8")
         return content.to_html().encode("utf-8")
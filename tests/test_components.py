@@ -1,4 +1,18 @@
-from ludic.catalog.forms import Form, InputField, TextAreaField
+from collections.abc import Hashable
+from dataclasses import FrozenInstanceError
+from typing import Annotated, override
+
+import pytest
+
+from ludic.attrs import Attrs, GlobalAttrs
+from ludic.base import RENDER_CACHE, clear_render_cache
+from ludic.catalog.forms import (
+    FieldMeta,
+    Form,
+    InputField,
+    TextAreaField,
+    create_fields,
+)
 from ludic.catalog.headers import H1, H2, H3, H4, Anchor
 from ludic.catalog.items import Key, Pairs, Value
 from ludic.catalog.messages import (
@@ -12,8 +26,10 @@ from ludic.catalog.messages import (
 from ludic.catalog.navigation import Navigation, NavItem
 from ludic.catalog.tables import Table, TableHead, TableRow
 from ludic.catalog.typography import Link, Paragraph
-from ludic.html import b
+from ludic.html import b, div, span
 from ludic.styles import themes
+from ludic.styles.types import Color
+from ludic.types import Component
 
 
 def test_link() -> None:
@@ -145,6 +161,49 @@ def test_form_fields() -> None:
     )  # fmt: skip
 
 
+def test_create_fields() -> None:
+    class PersonAttrs(Attrs, total=False):
+        name: Annotated[str, FieldMeta(label="Name")]
+        last_name: Annotated[str, FieldMeta()]
+        note: Annotated[str, FieldMeta(label=None)]
+        active: Annotated[bool, FieldMeta(kind="checkbox", label=None)]
+        email: Annotated[str, FieldMeta(label=None)]
+        bio: Annotated[str, FieldMeta(kind="textarea", label="Bio")]
+
+    attrs = PersonAttrs(
+        name="", last_name="Doe", note="Note", active=False, bio="About me"
+    )
+    form = Form(*create_fields(attrs, spec=PersonAttrs))
+
+    assert form.to_html() == (
+        '<form class="form stack">'
+            '<div class="form-field">'
+                '<label for="name">Name</label>'
+                '<input type="text" name="name" id="name" />'
+            "</div>"
+            '<div class="form-field">'
+                '<label for="last_name">Last Name</label>'
+                '<input value="Doe" type="text" name="last_name" id="last_name" />'
+            "</div>"
+            '<div class="form-field">'
+                '<input value="Note" type="text" name="note" id="note" />'
+            "</div>"
+            '<div class="form-field">'
+                '<input type="checkbox" name="active" id="active" />'
+            "</div>"
+            '<div class="form-field">'
+                '<label for="bio">Bio</label>'
+                '<textarea name="bio" id="bio">About me</textarea>'
+            "</div>"
+        "</form>"
+    )  # fmt: skip
+
+
+def test_field_meta_frozen() -> None:
+    with pytest.raises(FrozenInstanceError):
+        FieldMeta().label = "Fixed"  # type: ignore[misc]
+
+
 def test_header_anchor() -> None:
     assert Anchor(target="test").to_html() == '<a href="#test" class="anchor">#</a>'
     assert (
@@ -215,3 +274,97 @@ def test_messages() -> None:
     assert MessageDanger("test").to_html() == (
         '<div class="message danger"><div class="content">test</div></div>'
     )
+
+
+def test_cacheable_component() -> None:
+    renders: list[str] = []
+
+    class Badge(Component[str, GlobalAttrs]):
+        cacheable = True
+
+        @override
+        def render(self) -> span:
+            renders.append(self.children[0])
+            return span(self.children[0], **self.attrs)
+
+    clear_render_cache()
+
+    assert div(Badge("new"), Badge("new")).to_html() == (
+        "<div><span>new</span><span>new</span></div>"
+    )
+    assert Badge("old").to_html() == "<span>old</span>"
+    assert renders == ["new", "old"]
+    assert len(RENDER_CACHE) == 2
+
+    assert Badge("new", style={"color": "red"}).to_html() == (
+        '<span style="color:red">new</span>'
+    )
+    assert renders == ["new", "old", "new"]
+    assert len(RENDER_CACHE) == 2
+
+    clear_render_cache()
+    assert Badge("new").to_html() == "<span>new</span>"
+    assert renders == ["new", "old", "new", "new"]
+
+
+def test_nested_cacheable_components(monkeypatch: pytest.MonkeyPatch) -> None:
+    keys: list[str] = []
+    renders: list[str] = []
+
+    class Badge(Component[str, GlobalAttrs]):
+        cacheable = True
+
+        @override
+        def _cache_key(self, cache_keys: dict[int, Hashable | None]) -> Hashable | None:
+            keys.append(self.text)
+            return super()._cache_key(cache_keys)
+
+        @override
+        def render(self) -> span:
+            renders.append(self.text)
+            return span(self.children[0], **self.attrs)
+
+    class Card(Component[Badge, GlobalAttrs]):
+        cacheable = True
+
+        @override
+        def render(self) -> div:
+            return div(*self.children, **self.attrs)
+
+    monkeypatch.setattr("ludic.base.RENDER_CACHE_MAXSIZE", 2)
+    clear_render_cache()
+
+    assert Card(Badge("a")).to_html() == "<div><span>a</span></div>"
+    assert keys == ["a"]
+    assert renders == ["a"]
+    assert len(RENDER_CACHE) == 2
+
+    assert Badge("a").to_html() == "<span>a</span>"
+    assert Badge("b").to_html() == "<span>b</span>"
+    assert Badge("a").to_html() == "<span>a</span>"
+    assert renders == ["a", "b"]
+
+    assert Badge("c").to_html() == "<span>c</span>"
+    assert Badge("a").to_html() == "<span>a</span>"
+    assert renders == ["a", "b", "c"]
+
+
+def test_cacheable_component_themes() -> None:
+    class Primary(Component[str, GlobalAttrs]):
+        cacheable = True
+
+        @override
+        def render(self) -> span:
+            return span(self.children[0], style={"color": self.theme.colors.primary})
+
+    clear_render_cache()
+
+    default_theme = themes.LightTheme()
+    custom_theme = themes.LightTheme(colors=themes.Colors(primary=Color("#ff0000")))
+
+    assert default_theme.use(Primary("a")).to_html() == (
+        '<span style="color:#4ecdc4">a</span>'
+    )
+    assert custom_theme.use(Primary("a")).to_html() == (
+        '<span style="color:#ff0000">a</span>'
+    )
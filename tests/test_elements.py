@@ -1,3 +1,5 @@
+import pytest
+
 from ludic.html import (
     a,
     b,
@@ -162,3 +164,16 @@ def test_repr_and_str() -> None:
         "  <p>3</p>\n"
         "</div>"
     )  # fmt: skip
+
+
+def test_custom_to_html() -> None:
+    class Raw(span):
+        def to_html(self) -> str:
+            return "<custom/>"
+
+    assert div(Raw("x"), b("y")).to_html() == "<div><custom/><b>y</b></div>"
+
+
+def test_undeclared_attribute() -> None:
+    with pytest.raises(KeyError):
+        div("x", foo="bar").to_html()
@@ -1,5 +1,10 @@
+from typing import override
+
+import pytest
+
 from ludic.html import div, script
-from ludic.types import JavaScript, Safe
+from ludic.types import Component, JavaScript, NoAttrs, Safe
+from ludic.utils import get_element_attrs_annotations
 
 
 def test_safe() -> None:
@@ -21,3 +26,19 @@ def test_javascript() -> None:
         script(JavaScript("document.write('<h2>HTML</h2>');")).to_html()
         == "<script>document.write('<h2>HTML</h2>');</script>"
     )
+
+
+def test_async_render() -> None:
+    with pytest.raises(TypeError):
+
+        class AsyncComponent(Component[str, NoAttrs]):
+            @override
+            async def render(self) -> div:  # type: ignore[override]
+                return div(*self.children)
+
+
+def test_attrs_annotations_read_only() -> None:
+    annotations = get_element_attrs_annotations(div)
+    with pytest.raises(TypeError):
+        annotations["foo"] = str  # type: ignore[index]
+    assert "foo" not in get_element_attrs_annotations(div)
@@ -0,0 +1,80 @@
+import threading
+from typing import override
+
+from starlette.testclient import TestClient
+
+from ludic.attrs import NoAttrs
+from ludic.html import div, li, ul
+from ludic.types import Component
+from ludic.web import LudicApp
+from ludic.web.responses import is_large_element
+
+app = LudicApp()
+render_threads: list[int] = []
+
+
+class Items(Component[li, NoAttrs]):
+    render_in_threadpool = True
+
+    @override
+    def render(self) -> ul:
+        render_threads.append(threading.get_ident())
+        return ul(*self.children)
+
+
+class GeneratedItems(Component[int, NoAttrs]):
+    render_in_threadpool = True
+
+    @override
+    def render(self) -> ul:
+        render_threads.append(threading.get_ident())
+        return ul(*(li(str(idx)) for idx in range(self.children[0])))
+
+
+@app.get("/small")
+async def small() -> div:
+    return div("Small")
+
+
+@app.get("/large")
+async def large() -> ul:
+    return ul(*(li(str(idx)) for idx in range(2000)))
+
+
+@app.get("/items")
+async def items() -> tuple[Items, dict[str, str]]:
+    thread = str(threading.get_ident())
+    return Items(*(li(str(idx)) for idx in range(2000))), {"X-Thread": thread}
+
+
+@app.get("/generated-items")
+async def generated_items() -> tuple[GeneratedItems, dict[str, str]]:
+    thread = str(threading.get_ident())
+    return GeneratedItems(2000), {"X-Thread": thread}
+
+
+def test_is_large_element() -> None:
+    assert not is_large_element(div("Small"))
+    assert not is_large_element(ul(li("1"), li("2")), limit=4)
+    assert is_large_element(ul(li("1"), li("2"), li("3")), limit=4)
+    assert is_large_element(Items(li("1"), li("2"), li("3")), limit=4)
+    assert not is_large_element(GeneratedItems(3), limit=4)
+
+
+def test_large_response() -> None:
+    html = f"<ul>{"".join(f"<li>{idx}</li>" for idx in range(2000))}</ul>"
+
+    with TestClient(app) as client:
+        assert client.get("/small").text == "<div>Small</div>"
+        assert client.get("/large").text == html
+
+        render_threads.clear()
+        response = client.get("/items")
+        assert response.text == html
+        assert len(render_threads) == 1
+        assert render_threads[0] != int(response.headers["X-Thread"])
+
+        render_threads.clear()
+        response = client.get("/generated-items")
+        assert response.text == html
+        assert render_threads == [int(response.headers["X-Thread"])]